@@ -7,44 +7,373 @@ Provides interactive setup and management of Jira resources.
 """
 
 import os
+import re
+import sys
 import json
+import time
+import random
 import base64
-import argparse
-import getpass
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
+from typing import Optional, List, Dict, Any, Iterator, Sequence, TextIO
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    # orjson parses API responses and writes cache/config JSON several times faster than the stdlib
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2) if indent else json.dumps(obj, separators=(',', ':'))
 
 CONFIG_FILE = 'jira_config.json'
+CACHE_FILE = os.path.expanduser('~/.jira_manager_cache.sqlite')
+
+# Lifetime of cached lookups in seconds
+CACHE_TTL = 60 * 60               # Project lists
+ISSUE_CACHE_TTL = 10 * 60         # Issue searches and details
+BOARD_CACHE_TTL = 24 * 60 * 60    # Board metadata
+STATUS_CACHE_TTL = 60             # In-memory board issues grouped by status
+
+# Requested page size for paginated list endpoints (servers may cap it lower)
+DEFAULT_PAGE_SIZE = 1000
+
+# "project = KEY" or "project in (KEY)" in a board filter's JQL
+_PROJECT_RE = re.compile(r'project\s*(?:=|in)\s*(?:\()?[\'"]*([A-Z][A-Z0-9]*)', re.IGNORECASE)
+
+# JIRA wiki markup stripped from descriptions and comments in a single pass:
+# {code}/{color} macros, user mentions, links, headers and emphasis markers
+_MARKUP_RE = re.compile(r'\{[^}]*\}|\[~[^\]]*\]|\[[^\]]*\|[^\]]*\]|h[1-6]\. |[*_#]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# A single number typed at the interactive selection prompts
+_INDEX_RE = re.compile(r'\d+')
+
+# Keywords in labels or description that raise an issue's business impact
+_IMPACT_RE = re.compile(r'outage|down|critical|security|data loss|customer impact|revenue', re.IGNORECASE)
+
+# Issue fields used by generate_executive_summary
+_ISSUE_DETAIL_FIELDS = ['summary', 'description', 'status', 'assignee', 'priority',
+                        'issuetype', 'components', 'labels', 'comment']
+
+# Statuses shown by the board issue views, and the backlog statuses grouped alongside them
+_DEFAULT_STATUSES = ('In Progress', 'In Review', 'Done')
+_BACKLOG_STATUSES = ('To Do', 'New', 'Open')
+
+# Issue fields used by board listings and the weekly report
+_BOARD_ISSUE_FIELDS = 'summary,status,assignee,priority,issuetype,updated'
+
+# Fields the weekly report categorizes on and renders; always fetched whatever --fields says
+_REPORT_FIELDS = ('summary', 'status', 'assignee', 'priority', 'updated')
+
+# Placeholder for missing names when reshaping GreenHopper issues
+_UNKNOWN = 'Unknown'
+
+# Jira timestamps: 2024-01-15, 2024-01-15T10:30:45.123+0000, 2024-01-15T10:30:45Z, ...
+_JIRA_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?)?$')
+
+# Fallback formats for anything the regex doesn't recognise
+_JIRA_DATE_FORMATS = [
+    '%Y-%m-%dT%H:%M:%S.%f%z',  # 2024-01-15T10:30:45.123+0000
+    '%Y-%m-%dT%H:%M:%S%z',     # 2024-01-15T10:30:45+0000
+    '%Y-%m-%dT%H:%M:%S.%fZ',   # 2024-01-15T10:30:45.123Z
+    '%Y-%m-%dT%H:%M:%SZ',      # 2024-01-15T10:30:45Z
+    '%Y-%m-%d',                # 2024-01-15
+]
+
+# Offset string ('+0000', '-05:00') -> tzinfo, shared across parsed dates
+_TZ_CACHE = {None: timezone.utc, 'Z': timezone.utc}
+
+# Worker threads for concurrent page fetches
+_MAX_WORKERS = 8
+
+# (connect, read) timeout in seconds applied to every request
+_TIMEOUT = (5, 30)
+
+# Connection pool size per host; large enough for concurrent fetches to share sockets
+_POOL_SIZE = 32
+
+# Extra attempts for a batch that is still rate limited after the adapter's retries
+_RATE_LIMIT_RETRIES = 2
+
+@lru_cache(maxsize=4096)
+def _clean_jira_text(text: str) -> str:
+    """Clean JIRA markup from text"""
+    if not text:
+        return ""
+    
+    # Remove common JIRA markup, then collapse newlines and runs of whitespace
+    text = _MARKUP_RE.sub('', text)
+    text = _WHITESPACE_RE.sub(' ', text)
+    
+    return text.strip()
+
+def _parse_indices(selection: str, count: int) -> List[int]:
+    """Turn a comma-separated list of 1-based choices into 0-based indices below count.
+    
+    Entries that aren't plain numbers or are out of range are skipped and reported.
+    """
+    indices, invalid, out_of_range = [], [], []
+    for token in selection.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if not _INDEX_RE.fullmatch(token):
+            invalid.append(token)
+        elif 1 <= int(token) <= count:
+            indices.append(int(token) - 1)
+        else:
+            out_of_range.append(token)
+    
+    if invalid:
+        print(f"⚠️  Ignored invalid entries: {', '.join(invalid)}")
+    if out_of_range:
+        print(f"⚠️  Ignored out-of-range numbers: {', '.join(out_of_range)} (choose 1-{count})")
+    return indices
+
+def _parse_offset(offset: str) -> timezone:
+    """Convert a UTC offset like '+0530' or '-05:00' to a cached tzinfo"""
+    tzinfo = _TZ_CACHE.get(offset)
+    if tzinfo is None:
+        digits = offset[1:].replace(':', '')
+        delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        tzinfo = timezone(-delta if offset[0] == '-' else delta)
+        _TZ_CACHE[offset] = tzinfo
+    return tzinfo
+
+@lru_cache(maxsize=4096)
+def _parse_jira_date(date_str: str) -> Optional[datetime]:
+    """Parse JIRA date string to datetime object"""
+    if not date_str:
+        return None
+    
+    match = _JIRA_DATE_RE.match(date_str)
+    if match:
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+        try:
+            return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                            microsecond, tzinfo=_parse_offset(offset))
+        except ValueError:
+            pass  # Out-of-range fields; let the strptime formats reject it as before
+    
+    for fmt in _JIRA_DATE_FORMATS:
+        try:
+            # Handle Z timezone
+            clean_date = date_str.replace('Z', '+0000') if date_str.endswith('Z') else date_str
+            return datetime.strptime(clean_date, fmt)
+        except ValueError:
+            continue
+    
+    return None
+
+@lru_cache(maxsize=4096)
+def _impact_score(issue_type: str, priority: str, labels: tuple, description: str) -> int:
+    """Score business impact from issue type, priority, labels and description"""
+    impact_score = 0
+    
+    # Priority-based scoring
+    priority_lower = priority.lower()
+    if 'critical' in priority_lower or 'highest' in priority_lower:
+        impact_score += 4
+    elif 'high' in priority_lower:
+        impact_score += 3
+    elif 'medium' in priority_lower:
+        impact_score += 2
+    else:
+        impact_score += 1
+    
+    # Type-based scoring
+    type_lower = issue_type.lower()
+    if 'bug' in type_lower and ('critical' in type_lower or 'blocker' in type_lower):
+        impact_score += 2
+    elif 'security' in type_lower:
+        impact_score += 2
+    elif 'feature' in type_lower or 'epic' in type_lower:
+        impact_score += 1
+    
+    # Labels and description keywords
+    if _IMPACT_RE.search(' '.join(labels) + ' ' + (description or '')):
+        impact_score += 1
+    
+    return impact_score
+
+def _wrap_gh(issue_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reshape a GreenHopper allData issue into the REST API issue layout"""
+    assignee = issue_data.get('assigneeName')
+    return {
+        'key': issue_data.get('key'),
+        'id': issue_data.get('id'),
+        'fields': {
+            'summary': issue_data.get('summary'),
+            'status': {'name': issue_data.get('statusName', _UNKNOWN), 'id': issue_data.get('statusId')},
+            'assignee': {'displayName': assignee} if assignee else None,
+            'priority': {'name': issue_data.get('priorityName', _UNKNOWN)},
+            'issuetype': {'name': issue_data.get('typeName', _UNKNOWN)},
+        },
+    }
+
+def cached(ttl: int):
+    """Cache a method's JSON-serializable result on disk, keyed by its arguments.
+    
+    Results are also memoised for the life of the instance, so repeated calls
+    within one run skip both the network and the database.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = self._cache_key(method.__name__, args, kwargs)
+            value = self._memo.get(key)
+            if value is not None:
+                return value
+            value = self._cache_lookup(key)
+            if value is None:
+                value = method(self, *args, **kwargs)
+                if value:  # Failed or empty lookups are retried next time
+                    self._cache_store(key, value, ttl)
+            if value:
+                self._memo[key] = value
+            return value
+        return wrapper
+    return decorator
+
+class _CacheMixin:
+    """SQLite-backed TTL cache for read-only Jira lookups"""
+    
+    def _cache_key(self, *parts) -> str:
+        """Build a cache key scoped to the current instance and credentials"""
+        identity = self.email or hashlib.sha256((self.personal_token or '').encode()).hexdigest()
+        raw = json.dumps([self.base_url, identity, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def _cache_conn(self) -> sqlite3.Connection:
+        """Open the cache database on first use"""
+        if self._cache_db is None:
+            self._cache_db = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+            self._cache_db.execute('PRAGMA journal_mode=WAL')
+            self._cache_db.execute(
+                'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)'
+            )
+        return self._cache_db
+    
+    def _cache_lookup(self, key: str) -> Any:
+        """Return a cached value, or None if missing, expired or refreshing"""
+        if self.refresh_cache:
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache_conn().execute(
+                    'SELECT value FROM cache WHERE key = ? AND expires > ?', (key, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return _loads(row[0]) if row else None
+    
+    def _cache_store(self, key: str, value: Any, ttl: int = CACHE_TTL):
+        """Store a value in the cache, pruning expired entries"""
+        now = time.time()
+        try:
+            with self._cache_lock:
+                conn = self._cache_conn()
+                with conn:
+                    conn.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)', (key, _dumps(value), now + ttl))
+                    conn.execute('DELETE FROM cache WHERE expires <= ?', (now,))
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not write cache: {e}")
+            self._cache_invalidate(key)
+    
+    def _cache_invalidate(self, key: str):
+        """Drop a single entry so a stale value isn't served after a failed write"""
+        self._memo.pop(key, None)
+        try:
+            with self._cache_lock:
+                with self._cache_conn() as conn:
+                    conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+        except sqlite3.Error:
+            pass  # The cache is unusable; lookups will miss and fall through to Jira
+    
+    def clear_cache(self):
+        """Discard all cached lookups, including those of other instances sharing CACHE_FILE"""
+        self._memo.clear()
+        self._board_issue_cache.clear()
+        try:
+            with self._cache_lock:
+                with self._cache_conn() as conn:
+                    conn.execute('DELETE FROM cache')
+            print(f"🗑️  Cleared cache ({CACHE_FILE})")
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not clear cache: {e}")
 
-class JiraManager:
-    def __init__(self):
+class JiraManager(_CacheMixin):
+    # Status keywords used to classify issues by activity, checked in this order
+    _BLOCKED = ('blocked', 'impediment', 'hold', 'waiting', 'stuck')
+    _DONE = ('done', 'closed', 'resolved', 'complete')
+    _PROGRESS = ('progress', 'development', 'active', 'working')
+    _KWMAP = (('blocked', _BLOCKED), ('completed', _DONE), ('started', _PROGRESS))
+    
+    # Markdown for each issue in a weekly report section
+    _STARTED_TMPL = "### [{key}]({browse}{key}): {summary}\n**Assignee:** {assignee} | **Priority:** {priority}\n"
+    _COMPLETED_TMPL = "### ✅ [{key}]({browse}{key}): {summary}\n**Assignee:** {assignee}\n"
+    _BLOCKED_TMPL = ("### 🚫 [{key}]({browse}{key}): {summary}\n**Status:** {status} | **Assignee:** {assignee}\n"
+                     "**Blocking Reason:** *[TODO: Add blocking reason]*\n")
+    _REPORT_TMPLS = {'started': _STARTED_TMPL, 'completed': _COMPLETED_TMPL, 'blocked': _BLOCKED_TMPL}
+    # Report sections in output order: (category, heading, activity phrase)
+    _REPORT_SECTIONS = (
+        ('started', 'Started', 'started'),
+        ('completed', 'Completed', 'completed'),
+        ('blocked', 'Blocked / Off-track', 'blocked or off-track'),
+    )
+    
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE):
         self.base_url = None
         self.email = None
         self.api_token = None
         self.personal_token = None
         self.auth_method = 'basic'  # 'basic' or 'token'
         self.api_version = None  # Will be detected: 'v2' or 'v3'
+        self._api_base = None  # REST API root for the detected version
+        self.page_size = page_size
         self.session = requests.Session()
         self.selected_projects = []
         self.selected_boards = []
+        self.refresh_cache = False
+        self._cache_db = None  # Opened lazily from CACHE_FILE
+        self._cache_lock = threading.Lock()
+        self._memo = {}  # In-process results of @cached methods
+        self._board_issue_cache = {}  # (board_id, statuses) -> (timestamp, issues_by_status)
+        self._board_api_choice = {}  # board_id -> board issue method that last worked
+        self._config_hash = None  # Digest of the settings as last loaded or saved
         
     def load_config(self) -> bool:
         """Load configuration from file"""
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    config = _loads(f.read())
                     self.base_url = config.get('base_url')
                     self.email = config.get('email')
                     self.api_token = config.get('api_token')
                     self.personal_token = config.get('personal_token')
                     self.auth_method = config.get('auth_method', 'basic')
                     self.api_version = config.get('api_version')
+                    self.page_size = config.get('page_size', self.page_size)
                     self.selected_projects = config.get('selected_projects', [])
-                    self.selected_boards = config.get('selected_boards', [])
+                    # Board IDs are kept as strings so they can be passed to the API as-is
+                    self.selected_boards = [{**b, 'id': str(b['id'])} for b in config.get('selected_boards', [])]
+                    self._config_hash = self._config_digest(self._config_dict())
                     
                     if self.base_url and ((self.auth_method == 'basic' and self.email and self.api_token) or 
                                          (self.auth_method == 'token' and self.personal_token)):
@@ -54,24 +383,58 @@ class JiraManager:
                 print("Invalid configuration file. Please run setup again.")
         return False
     
-    def save_config(self):
-        """Save configuration to file"""
-        config = {
+    def _config_dict(self) -> Dict[str, Any]:
+        """Current settings in the layout of the configuration file"""
+        return {
             'base_url': self.base_url,
             'email': self.email,
             'api_token': self.api_token,
             'personal_token': self.personal_token,
             'auth_method': self.auth_method,
             'api_version': self.api_version,
+            'page_size': self.page_size,
             'selected_projects': self.selected_projects,
             'selected_boards': self.selected_boards
         }
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+    
+    @staticmethod
+    def _config_digest(config: Dict[str, Any]) -> bytes:
+        """Order-independent fingerprint of a configuration"""
+        return hashlib.blake2b(json.dumps(config, sort_keys=True).encode()).digest()
+    
+    def save_config(self, compact: bool = False):
+        """Save configuration to file (atomically, so a crash can't corrupt it).
+        
+        Nothing is written when the settings haven't changed since they were
+        loaded or last saved.
+        """
+        config = self._config_dict()
+        digest = self._config_digest(config)
+        if digest == self._config_hash and os.path.exists(CONFIG_FILE):
+            print(f"Configuration unchanged ({CONFIG_FILE})")
+            return
+        
+        tmp_file = CONFIG_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(_dumps(config, indent=not compact))
+        os.replace(tmp_file, CONFIG_FILE)
+        self._config_hash = digest
         print(f"Configuration saved to {CONFIG_FILE}")
     
     def setup_session(self):
         """Setup authenticated session"""
+        self._set_api_version(self.api_version)
+        
+        # Endpoint templates, formatted with a board ID at each call site
+        agile = f"{self.base_url}/rest/agile/1.0"
+        greenhopper = f"{self.base_url}/rest/greenhopper/1.0"
+        self._url_agile_boards = f"{agile}/board"
+        self._url_agile_board = f"{agile}/board/{{}}"
+        self._url_agile_board_issues = f"{agile}/board/{{}}/issue"
+        self._url_greenhopper_views = f"{greenhopper}/rapidview"
+        self._url_greenhopper_view = f"{greenhopper}/rapidview/{{}}"
+        self._url_greenhopper_board_data = f"{greenhopper}/xboard/work/allData/?rapidViewId={{}}"
+        
         if self.auth_method == 'token':
             self.session.headers.update({
                 'Authorization': f'Bearer {self.personal_token}',
@@ -84,9 +447,33 @@ class JiraManager:
                 'Accept': 'application/json',
                 'Content-Type': 'application/json'
             })
+        
+        # Keep connections alive and retry transient failures (rate limits, gateway errors)
+        retry = Retry(
+            total=5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=0.5,
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)  # Jira Server installs are often plain HTTP
+        self.session.headers['Connection'] = 'keep-alive'
+    
+    def _set_api_version(self, api_version: Optional[str]):
+        """Record the REST API version and the endpoint root derived from it"""
+        self.api_version = api_version
+        self._api_base = f"{self.base_url}/rest/api/{'2' if api_version == 'v2' else '3'}"
+        self._url_project = f"{self._api_base}/project"
+        self._url_project_search = f"{self._api_base}/project/search"
+        self._url_search = f"{self._api_base}/search"
     
     def interactive_setup(self):
         """Interactive setup to gather Jira credentials and preferences"""
+        import getpass  # Only needed for interactive credential entry
+        
         print("🔧 Jira Manager Setup")
         print("=" * 50)
         
@@ -191,23 +578,33 @@ class JiraManager:
             else:
                 print(f"Using email: {self.email}")
             
-            # Try API v3 first (Cloud), fallback to v2 (Server)
-            api_endpoint = f"{self.base_url}/rest/api/3/myself"
-            response = self.session.get(api_endpoint)
+            # Probe API v3 (Cloud) and v2 (Server) concurrently, preferring v3
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                v3_probe = executor.submit(self.session.get, f"{self.base_url}/rest/api/3/myself",
+                                           stream=True, timeout=_TIMEOUT)
+                v2_probe = executor.submit(self.session.get, f"{self.base_url}/rest/api/2/myself",
+                                           stream=True, timeout=_TIMEOUT)
+            response = v3_probe.result()
             
-            # If v3 fails, try v2 for Jira Server
-            if response.status_code == 404 or (response.status_code == 200 and response.text.strip().startswith('<')):
-                print("API v3 not found, trying API v2 (Jira Server)...")
-                api_endpoint = f"{self.base_url}/rest/api/2/myself"
-                response = self.session.get(api_endpoint)
-                self.api_version = 'v2'
+            # If v3 fails, use v2 for Jira Server (or when a login/redirect page came back instead)
+            if response.status_code == 404 or (response.status_code == 200 and self._is_html(response)):
+                print("API v3 not found, using API v2 (Jira Server)...")
+                response.close()
+                response = v2_probe.result()
+                self._set_api_version('v2')
             else:
-                self.api_version = 'v3'
+                if v2_probe.exception() is None:
+                    v2_probe.result().close()
+                self._set_api_version('v3')
             print(f"Response status: {response.status_code}")
             
+            if response.status_code != 200:
+                # Only the start of an error body is ever shown, don't download the rest
+                body = self._peek(response)
+            
             if response.status_code == 200:
                 try:
-                    user_info = response.json()
+                    user_info = _loads(response.content)
                     print(f"Connected as: {user_info.get('displayName', 'Unknown User')}")
                     return True
                 except json.JSONDecodeError:
@@ -240,10 +637,10 @@ class JiraManager:
             else:
                 print(f"❌ Unexpected error: {response.status_code}")
                 try:
-                    error_details = response.json()
+                    error_details = json.loads(body)
                     print(f"Error details: {error_details}")
-                except:
-                    print(f"Response text: {response.text}")
+                except ValueError:
+                    print(f"Response text: {body}")
                 return False
         except requests.ConnectionError as e:
             print(f"❌ Network connection error: {e}")
@@ -254,36 +651,62 @@ class JiraManager:
             print(f"❌ Request error: {e}")
             return False
     
-    def get_projects(self) -> List[Dict[str, Any]]:
-        """Fetch all projects"""
+    def get_projects(self, query: str = None, page_size: int = None) -> List[Dict[str, Any]]:
+        """Fetch projects, optionally filtered server-side by name or key"""
+        cache_key = self._cache_key('projects', self.api_version, query)
+        projects = self._cache_lookup(cache_key)
+        if projects is not None:
+            print(f"Using cached project list ({len(projects)} projects)")
+            return projects
+        
         try:
-            # Use detected API version or try both
-            if self.api_version == 'v2':
-                api_endpoint = f"{self.base_url}/rest/api/2/project"
-            else:
-                api_endpoint = f"{self.base_url}/rest/api/3/project"
-            
+            api_endpoint = self._url_project_search
             print(f"Trying to fetch projects from: {api_endpoint}")
-            response = self.session.get(api_endpoint)
+            params = {'startAt': 0, 'maxResults': page_size or self.page_size}
+            if query:
+                params['query'] = query
+            
+            try:
+                projects, response = self._paginated_get(api_endpoint, params)
+            except json.JSONDecodeError:
+                # HTML or other non-JSON body, let the legacy endpoint handle it
+                projects, response = None, None
             
-            # Check if we got HTML instead of JSON (indicates wrong endpoint or auth issue)
-            if response.status_code == 200 and response.text.strip().startswith('<'):
-                print("Got HTML response, trying other API version...")
-                if self.api_version != 'v2':
-                    api_endpoint = f"{self.base_url}/rest/api/2/project"
-                    print(f"Trying: {api_endpoint}")
-                    response = self.session.get(api_endpoint)
-            elif response.status_code == 404 and self.api_version != 'v2':
-                print("API v3 not found, trying API v2...")
-                api_endpoint = f"{self.base_url}/rest/api/2/project"
-                print(f"Trying: {api_endpoint}")
-                response = self.session.get(api_endpoint)
+            if projects is not None:
+                print(f"Successfully fetched {len(projects)} projects")
+                self._index_projects(projects)
+                self._cache_store(cache_key, projects)
+                return projects
+            
+            if response is None or response.status_code == 404:
+                # Older Jira Server has no paginated search, fetch the full list instead
+                print("Project search not available, falling back to full project list...")
+                projects = self._index_projects(self._get_all_projects())
+                if query:
+                    projects = self.find_project_by_name(projects, query)
+                if projects:
+                    self._cache_store(cache_key, projects)
+                return projects
+            
+            print(f"Failed to fetch projects: {response.status_code}")
+            print(f"Response: {self._peek(response)[:200]}...")
+            return []
+        except requests.RequestException as e:
+            print(f"Network error fetching projects: {e}")
+            return []
+    
+    def _get_all_projects(self) -> List[Dict[str, Any]]:
+        """Fetch all projects from the legacy non-paginated endpoint"""
+        try:
+            api_endpoint = self._url_project
+            print(f"Trying to fetch projects from: {api_endpoint}")
+            response = self.session.get(api_endpoint, stream=True, timeout=_TIMEOUT)
             
             print(f"Projects API response status: {response.status_code}")
             
             if response.status_code == 200:
                 try:
-                    projects = response.json()
+                    projects = _loads(response.content)
                     print(f"Successfully fetched {len(projects)} projects")
                     return projects
                 except json.JSONDecodeError as e:
@@ -292,7 +715,7 @@ class JiraManager:
                     return []
             else:
                 print(f"Failed to fetch projects: {response.status_code}")
-                print(f"Response: {response.text[:200]}...")
+                print(f"Response: {self._peek(response)[:200]}...")
                 return []
         except requests.RequestException as e:
             print(f"Network error fetching projects: {e}")
@@ -302,45 +725,196 @@ class JiraManager:
         """Fetch all boards using multiple methods"""
         boards = []
         
-        # Method 1: Try Agile API (works for both Cloud and some Server instances)
+        # Methods 1 and 2: probe Agile and GreenHopper APIs concurrently. Agile has the
+        # accurate project keys and board types, so GreenHopper is only a fallback.
+        # The probes don't print, so only the chosen probe's messages reach the user.
+        executor = ThreadPoolExecutor(max_workers=2)
+        agile_future = executor.submit(self._probe_agile)
+        greenhopper_future = executor.submit(self._probe_greenhopper)
         try:
-            print("Trying Agile API for boards...")
-            response = self.session.get(f"{self.base_url}/rest/agile/1.0/board")
-            print(f"Agile API response status: {response.status_code}")
+            found, agile_messages = agile_future.result()
+            if found:
+                print('\n'.join(agile_messages))
+                print(f"Total boards found: {len(found)}")
+                return found
             
-            if response.status_code == 200:
+            found, greenhopper_messages = greenhopper_future.result()
+            if found:
+                print('\n'.join(greenhopper_messages))
+                print(f"Total boards found: {len(found)}")
+                return found
+            print('\n'.join(agile_messages + greenhopper_messages))
+        finally:
+            # A silent GreenHopper probe may still be running after Agile answered
+            greenhopper_future.cancel()
+            executor.shutdown(wait=False)
+        
+        # Method 3: Create mock boards based on projects (fallback)
+        if not boards and self.selected_projects:
+            print("No boards found via APIs, creating project-based entries...")
+            for project in self.selected_projects:
+                board = {
+                    'id': f"project-{project['key']}",
+                    'name': f"{project['name']} (Project View)",
+                    'type': 'project',
+                    'location': {
+                        'projectKey': project['key']
+                    }
+                }
+                boards.append(board)
+        
+        print(f"Total boards found: {len(boards)}")
+        return boards
+    
+    def _probe_agile(self):
+        """Fetch boards via the Agile API (works for both Cloud and some Server instances).
+        
+        Returns (boards, messages); boards is None on failure. Messages are left to
+        the caller to print, since this runs on a worker thread.
+        """
+        messages = ["Trying Agile API for boards..."]
+        try:
+            try:
+                boards, response = self._paginated_get(self._url_agile_boards)
+            except json.JSONDecodeError as e:
+                messages.append(f"Agile API JSON decode error: {e}")
+                return None, messages
+            messages.append(f"Agile API response status: {response.status_code}")
+            
+            if boards is not None:
+                messages.append(f"Found {len(boards)} boards via Agile API")
+                return boards, messages
+            
+            messages.append(f"Agile API failed: {response.status_code}")
+            if response.status_code == 401:
+                messages.append("Authentication issue with Agile API")
+            elif response.status_code == 403:
+                messages.append("No permission to access Agile API")
+            elif response.status_code == 404:
+                messages.append("Agile API not available (common in older Jira Server)")
+        except requests.RequestException as e:
+            messages.append(f"Agile API error: {e}")
+        return None, messages
+    
+    def _paginated_get(self, endpoint: str, params: Dict[str, Any] = None, key: str = 'values',
+                       workers: int = _MAX_WORKERS, max_results: Optional[int] = None):
+        """Fetch every page of a startAt/maxResults paginated endpoint.
+        
+        The first page reports the total, so the remaining pages are requested
+        concurrently. At most max_results items are returned when it is given.
+        Returns (items, first_response); items is None when the first page failed,
+        in which case the response is kept for error reporting. A first page that
+        isn't JSON raises json.JSONDecodeError; later bad pages are skipped.
+        """
+        params = dict(params or {})
+        params.setdefault('startAt', 0)
+        params.setdefault('maxResults', self.page_size)
+        if max_results is not None:
+            params['maxResults'] = min(params['maxResults'], max_results)
+        
+        response = self.session.get(endpoint, params=params, stream=True, timeout=_TIMEOUT)
+        if response.status_code != 200:
+            return None, response
+        
+        data = _loads(response.content)
+        items = list(data.get(key, []))
+        if data.get('isLast') or not items or (max_results is not None and len(items) >= max_results):
+            return items[:max_results], response
+        
+        start = params['startAt'] + len(items)
+        total = data.get('total')
+        if total is not None and max_results is not None:
+            total = min(total, params['startAt'] + max_results)
+        if total is not None and start >= total:
+            return items, response
+        
+        self._adjust_page_size(params, len(items))
+        
+        if total is None:
+            # No total reported, walk the remaining pages sequentially
+            while True:
+                params['startAt'] = start
+                page = self.session.get(endpoint, params=params, timeout=_TIMEOUT)
+                if page.status_code != 200:
+                    print(f"⚠️  Failed to fetch page at {start}: {page.status_code}")
+                    break
                 try:
-                    data = response.json()
-                    boards = data.get('values', [])
-                    print(f"Found {len(boards)} boards via Agile API")
-                    if boards:
-                        return boards
+                    data = _loads(page.content)
                 except json.JSONDecodeError as e:
-                    print(f"Agile API JSON decode error: {e}")
-            else:
-                print(f"Agile API failed: {response.status_code}")
-                if response.status_code == 401:
-                    print("Authentication issue with Agile API")
-                elif response.status_code == 403:
-                    print("No permission to access Agile API")
-                elif response.status_code == 404:
-                    print("Agile API not available (common in older Jira Server)")
-        except requests.RequestException as e:
-            print(f"Agile API error: {e}")
+                    print(f"⚠️  Invalid JSON in page at {start}: {e}")
+                    break
+                values = data.get(key, [])
+                items.extend(values)
+                start += len(values)
+                if data.get('isLast', True) or not values:
+                    break
+                if max_results is not None and len(items) >= max_results:
+                    break
+            return items[:max_results], response
+        
+        offsets = range(start, total, params['maxResults'])
+        if not offsets:
+            return items, response
+        
+        def fetch_page(offset):
+            page = self.session.get(endpoint, params=dict(params, startAt=offset), timeout=_TIMEOUT)
+            if page.status_code != 200:
+                print(f"⚠️  Failed to fetch page at {offset}: {page.status_code}")
+                return []
+            try:
+                return _loads(page.content).get(key, [])
+            except json.JSONDecodeError as e:
+                print(f"⚠️  Invalid JSON in page at {offset}: {e}")
+                return []
+        
+        # map() yields pages in startAt order regardless of completion order
+        with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as executor:
+            for values in executor.map(fetch_page, offsets):
+                items.extend(values)
+        return items[:max_results], response
+    
+    def _peek(self, response, limit: int = 4096) -> str:
+        """Read at most one chunk of a streamed response body and release the connection"""
+        try:
+            chunk = next(response.iter_content(chunk_size=limit), b'')
+        finally:
+            response.close()
+        return chunk.decode('utf-8', errors='replace')
+    
+    def _is_html(self, response) -> bool:
+        """Check whether a response is an HTML page rather than API JSON.
+        
+        Login and SSO pages aren't always labelled text/html, so the start of the
+        body is checked too (reading it caches the content for later decoding).
+        """
+        if response.headers.get('Content-Type', '').startswith('text/html'):
+            return True
+        return response.content.lstrip()[:1] == b'<'
+    
+    def _adjust_page_size(self, params: Dict[str, Any], received: int):
+        """Shrink the requested page size to what the server actually returns"""
+        if 0 < received < params['maxResults']:
+            print(f"⚠️  Server capped page size at {received} (requested {params['maxResults']}), using {received}")
+            params['maxResults'] = received
+    
+    def _probe_greenhopper(self):
+        """Fetch boards via the GreenHopper API (older Jira Server).
         
-        # Method 2: Try GreenHopper API (older Jira Server)
+        Returns (boards, messages) like _probe_agile.
+        """
+        messages = ["Trying GreenHopper API for boards..."]
         try:
-            print("Trying GreenHopper API for boards...")
-            response = self.session.get(f"{self.base_url}/rest/greenhopper/1.0/rapidview")
-            print(f"GreenHopper API response status: {response.status_code}")
+            response = self.session.get(self._url_greenhopper_views, timeout=_TIMEOUT)
+            messages.append(f"GreenHopper API response status: {response.status_code}")
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _loads(response.content)
                     views = data.get('views', [])
-                    print(f"Found {len(views)} rapid views via GreenHopper API")
+                    messages.append(f"Found {len(views)} rapid views via GreenHopper API")
                     
                     # Convert GreenHopper format to standard board format
+                    boards = []
                     for view in views:
                         board = {
                             'id': view.get('id'),
@@ -351,76 +925,90 @@ class JiraManager:
                             }
                         }
                         boards.append(board)
-                    
-                    if boards:
-                        return boards
+                    return boards, messages
                 except json.JSONDecodeError as e:
-                    print(f"GreenHopper API JSON decode error: {e}")
+                    messages.append(f"GreenHopper API JSON decode error: {e}")
             else:
-                print(f"GreenHopper API failed: {response.status_code}")
+                messages.append(f"GreenHopper API failed: {response.status_code}")
         except requests.RequestException as e:
-            print(f"GreenHopper API error: {e}")
-        
-        # Method 3: Create mock boards based on projects (fallback)
-        if not boards and self.selected_projects:
-            print("No boards found via APIs, creating project-based entries...")
-            for project in self.selected_projects:
-                board = {
-                    'id': f"project-{project['key']}",
-                    'name': f"{project['name']} (Project View)",
-                    'type': 'project',
-                    'location': {
-                        'projectKey': project['key']
-                    }
-                }
-                boards.append(board)
-        
-        print(f"Total boards found: {len(boards)}")
-        return boards
+            messages.append(f"GreenHopper API error: {e}")
+        return None, messages
     
     def _extract_project_from_filter(self, filter_query: str) -> str:
         """Extract project key from JQL filter query"""
-        import re
         if not filter_query:
             return 'N/A'
         
-        # Look for "project = KEY" or "project in (KEY)" patterns
-        match = re.search(r'project\s*(?:=|in)\s*(?:\()?[\'"]*([A-Z][A-Z0-9]*)', filter_query, re.IGNORECASE)
+        match = _PROJECT_RE.search(filter_query)
         if match:
             return match.group(1)
         return 'N/A'
     
     def get_issue_details(self, issue_key: str) -> Optional[Dict[str, Any]]:
         """Get detailed information for a specific issue"""
-        try:
-            # Try API v3 first, fallback to v2
-            if self.api_version == 'v2':
-                api_endpoint = f"{self.base_url}/rest/api/2/issue/{issue_key}"
+        return self.get_issue_details_bulk([issue_key]).get(issue_key)
+    
+    def get_issue_details_bulk(self, issue_keys: List[str], chunk: int = 100,
+                               max_workers: int = _MAX_WORKERS) -> Dict[str, Dict[str, Any]]:
+        """Get detailed information for many issues, one JQL search per chunk of keys"""
+        details = {}
+        missing = []
+        for key in issue_keys:
+            issue = self._cache_lookup(self._cache_key('issue', key))
+            if issue is not None:
+                details[key] = issue
             else:
-                api_endpoint = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-            
-            # Request additional fields for detailed information
-            params = {
-                'expand': 'changelog,renderedFields',
-                'fields': 'summary,description,status,assignee,priority,issuetype,created,updated,components,labels,fixVersions,comment'
+                missing.append(key)
+        
+        chunks = [missing[i:i + chunk] for i in range(0, len(missing), chunk)]
+        if not chunks:
+            return details
+        
+        def fetch_chunk(keys):
+            jql = 'key in (' + ','.join(f'"{key}"' for key in keys) + ')'
+            body = {
+                'jql': jql,
+                'fields': _ISSUE_DETAIL_FIELDS,
+                'maxResults': len(keys),
+                'validateQuery': 'warn'  # Unknown keys shouldn't fail the whole batch
             }
-            
-            response = self.session.get(api_endpoint, params=params)
-            
-            if response.status_code == 404 and self.api_version != 'v2':
-                # Try v2 if v3 fails
-                api_endpoint = f"{self.base_url}/rest/api/2/issue/{issue_key}"
-                response = self.session.get(api_endpoint, params=params)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to fetch details for {issue_key}: {response.status_code}")
-                return None
-                
-        except requests.RequestException as e:
-            print(f"Error fetching details for {issue_key}: {e}")
-            return None
+            for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                try:
+                    # POST keeps long key lists out of the URL
+                    response = self.session.post(self._url_search, json=body, timeout=_TIMEOUT)
+                except requests.RequestException as e:
+                    print(f"Error fetching details for {', '.join(keys)}: {e}")
+                    return []
+                if response.status_code == 200:
+                    try:
+                        return _loads(response.content).get('issues', [])
+                    except json.JSONDecodeError as e:
+                        print(f"Failed to fetch details for {', '.join(keys)}: {e}")
+                        return []
+                if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+                    break
+                # Still rate limited after the adapter's retries; back off with jitter
+                # so the parallel chunks don't all retry at the same moment
+                time.sleep(2 ** attempt + random.uniform(0, 1))
+            print(f"Failed to fetch details for {', '.join(keys)}: {response.status_code}")
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            for issues in executor.map(fetch_chunk, chunks):
+                for issue in issues:
+                    details[issue['key']] = issue
+                    self._cache_store(self._cache_key('issue', issue['key']), issue, ISSUE_CACHE_TTL)
+        return details
+    
+    def summarize_issues_parallel(self, issue_keys: List[str], max_workers: int = _MAX_WORKERS) -> Dict[str, str]:
+        """Fetch details for many issues concurrently and return their executive summaries by key.
+        
+        Issues whose details can't be fetched are left out of the result.
+        """
+        print(f"🔍 Fetching details for {len(issue_keys)} issues...")
+        details_by_key = self.get_issue_details_bulk(issue_keys, max_workers=max_workers)
+        # Summaries are built locally from the fetched fields, so only the fetch needs threads
+        return {key: self.generate_executive_summary(details) for key, details in details_by_key.items()}
     
     def generate_executive_summary(self, issue_details: Dict[str, Any]) -> str:
         """Generate an executive summary for an issue"""
@@ -452,8 +1040,9 @@ class JiraManager:
         
         # Basic description
         if description:
-            # Clean up description (remove markup, truncate)
-            clean_desc = self._clean_jira_text(description)
+            # Clean up description (remove markup, truncate); only the head is shown,
+            # so bound the cleanup work with slack for markup that gets stripped
+            clean_desc = _clean_jira_text(description[:2048])
             if len(clean_desc) > 200:
                 clean_desc = clean_desc[:197] + "..."
             summary_parts.append(f"**Description:** {clean_desc}")
@@ -469,7 +1058,7 @@ class JiraManager:
         if recent_comments:
             latest_comment = recent_comments[-1]
             comment_author = latest_comment.get('author', {}).get('displayName', 'Unknown')
-            comment_text = self._clean_jira_text(latest_comment.get('body', ''))
+            comment_text = _clean_jira_text(latest_comment.get('body', '')[:1024])
             if len(comment_text) > 100:
                 comment_text = comment_text[:97] + "..."
             summary_parts.append(f"**Latest Update ({comment_author}):** {comment_text}")
@@ -480,56 +1069,9 @@ class JiraManager:
         
         return '\n'.join(summary_parts)
     
-    def _clean_jira_text(self, text: str) -> str:
-        """Clean JIRA markup from text"""
-        if not text:
-            return ""
-        
-        import re
-        
-        # Remove common JIRA markup
-        text = re.sub(r'\{[^}]*\}', '', text)  # Remove {code}, {color}, etc.
-        text = re.sub(r'\[~[^\]]*\]', '', text)  # Remove user mentions
-        text = re.sub(r'\[[^\]]*\|[^\]]*\]', '', text)  # Remove links
-        text = re.sub(r'h[1-6]\. ', '', text)  # Remove headers
-        text = re.sub(r'[*_#]+', '', text)  # Remove emphasis markup
-        text = re.sub(r'\n+', ' ', text)  # Replace newlines with spaces
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-        
-        return text.strip()
-    
     def _assess_business_impact(self, issue_type: str, priority: str, labels: List[str], description: str) -> str:
         """Assess business impact based on issue characteristics"""
-        impact_score = 0
-        
-        # Priority-based scoring
-        priority_lower = priority.lower()
-        if 'critical' in priority_lower or 'highest' in priority_lower:
-            impact_score += 4
-        elif 'high' in priority_lower:
-            impact_score += 3
-        elif 'medium' in priority_lower:
-            impact_score += 2
-        else:
-            impact_score += 1
-        
-        # Type-based scoring
-        type_lower = issue_type.lower()
-        if 'bug' in type_lower and ('critical' in type_lower or 'blocker' in type_lower):
-            impact_score += 2
-        elif 'security' in type_lower:
-            impact_score += 2
-        elif 'feature' in type_lower or 'epic' in type_lower:
-            impact_score += 1
-        
-        # Labels and description keywords
-        high_impact_keywords = ['outage', 'down', 'critical', 'security', 'data loss', 'customer impact', 'revenue']
-        text_to_check = ' '.join(labels + [description]).lower()
-        
-        for keyword in high_impact_keywords:
-            if keyword in text_to_check:
-                impact_score += 1
-                break
+        impact_score = _impact_score(issue_type, priority, tuple(labels), description)
         
         # Determine impact level
         if impact_score >= 6:
@@ -539,18 +1081,19 @@ class JiraManager:
         else:
             return "🟢 **LOW** - Minimal business impact, can be addressed in normal workflow"
     
+    @cached(ttl=BOARD_CACHE_TTL)
     def get_board_by_id(self, board_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific board by ID"""
         try:
             # Try Agile API first
-            response = self.session.get(f"{self.base_url}/rest/agile/1.0/board/{board_id}")
+            response = self.session.get(self._url_agile_board.format(board_id), timeout=_TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                return _loads(response.content)
             
             # Try GreenHopper API
-            response = self.session.get(f"{self.base_url}/rest/greenhopper/1.0/rapidview/{board_id}")
+            response = self.session.get(self._url_greenhopper_view.format(board_id), timeout=_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 return {
                     'id': data.get('id'),
                     'name': data.get('name'),
@@ -563,31 +1106,30 @@ class JiraManager:
             pass
         return None
     
+    def _index_projects(self, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach lowercased name and key to each project for repeated searches"""
+        for project in projects:
+            project['_name_lower'] = project['name'].lower()
+            project['_key_lower'] = project['key'].lower()
+        return projects
+    
     def find_project_by_name(self, projects: List[Dict[str, Any]], search_term: str) -> List[Dict[str, Any]]:
         """Find projects by name or key (case insensitive)"""
         search_term = search_term.lower()
         matches = []
         
         for project in projects:
-            project_name = project['name'].lower()
-            project_key = project['key'].lower()
+            project_name = project.get('_name_lower') or project['name'].lower()
+            project_key = project.get('_key_lower') or project['key'].lower()
             
-            if (search_term in project_name or 
-                search_term in project_key or 
-                project_name == search_term or 
-                project_key == search_term):
+            # Substring match also covers an exact name or key
+            if search_term in project_name or search_term in project_key:
                 matches.append(project)
         
         return matches
     
     def select_projects(self):
         """Interactive project selection with name search"""
-        projects = self.get_projects()
-        if not projects:
-            print("No projects found or unable to fetch projects.")
-            return
-        
-        print(f"\nFound {len(projects)} projects available.")
         print("\nProject Selection Options:")
         print("1. Enter project name or key to search")
         print("2. List all projects and select by number")
@@ -595,15 +1137,22 @@ class JiraManager:
         
         choice = input("\nEnter choice (1-3): ").strip()
         
+        if choice != "1":
+            projects = self.get_projects()
+            if not projects:
+                print("No projects found or unable to fetch projects.")
+                return
+            print(f"\nFound {len(projects)} projects available.")
+        
         if choice == "1":
-            # Search by name/key
+            # Search by name/key (filtered server-side)
             while True:
                 search_term = input("\nEnter project name or key to search: ").strip()
                 if not search_term:
                     print("Please enter a search term.")
                     continue
                 
-                matches = self.find_project_by_name(projects, search_term)
+                matches = self.get_projects(query=search_term)
                 
                 if not matches:
                     print(f"No projects found matching '{search_term}'")
@@ -669,15 +1218,10 @@ class JiraManager:
             if selection.lower() == 'all':
                 self.selected_projects = [{'key': p['key'], 'name': p['name']} for p in projects]
             else:
-                try:
-                    indices = [int(x.strip()) - 1 for x in selection.split(',') if x.strip()]
-                    self.selected_projects = [
-                        {'key': projects[i]['key'], 'name': projects[i]['name']} 
-                        for i in indices if 0 <= i < len(projects)
-                    ]
-                except ValueError:
-                    print("Invalid selection. No projects selected.")
-                    self.selected_projects = []
+                self.selected_projects = [
+                    {'key': projects[i]['key'], 'name': projects[i]['name']} 
+                    for i in _parse_indices(selection, len(projects))
+                ]
         
         print(f"\nSelected {len(self.selected_projects)} project(s):")
         for project in self.selected_projects:
@@ -688,7 +1232,7 @@ class JiraManager:
         if not self.selected_projects:
             return boards
         
-        selected_project_keys = [p['key'] for p in self.selected_projects]
+        selected_project_keys = {p['key'] for p in self.selected_projects}
         filtered_boards = []
         
         for board in boards:
@@ -743,10 +1287,12 @@ class JiraManager:
         print("\nAvailable boards:")
         print("-" * 60)
         
+        lines = []
         for i, board in enumerate(boards, 1):
             board_type = board.get('type', 'unknown')
             project_key = board.get('location', {}).get('projectKey', 'N/A')
-            print(f"{i:2}. {board['name']} ({board_type}) - Project: {project_key}")
+            lines.append(f"{i:2}. {board['name']} ({board_type}) - Project: {project_key}")
+        sys.stdout.write('\n'.join(lines) + '\n')
         
         print(f"\nSelect boards (1-{len(boards)}, comma-separated, or 'all' for all boards):")
         selection = input("Boards: ").strip()
@@ -754,7 +1300,7 @@ class JiraManager:
         if selection.lower() == 'all':
             self.selected_boards = [
                 {
-                    'id': b['id'], 
+                    'id': str(b['id']), 
                     'name': b['name'], 
                     'type': b.get('type'),
                     'project_key': b.get('location', {}).get('projectKey')
@@ -762,20 +1308,15 @@ class JiraManager:
                 for b in boards
             ]
         else:
-            try:
-                indices = [int(x.strip()) - 1 for x in selection.split(',') if x.strip()]
-                self.selected_boards = [
-                    {
-                        'id': boards[i]['id'], 
-                        'name': boards[i]['name'], 
-                        'type': boards[i].get('type'),
-                        'project_key': boards[i].get('location', {}).get('projectKey')
-                    } 
-                    for i in indices if 0 <= i < len(boards)
-                ]
-            except ValueError:
-                print("Invalid selection. No boards selected.")
-                self.selected_boards = []
+            self.selected_boards = [
+                {
+                    'id': str(boards[i]['id']), 
+                    'name': boards[i]['name'], 
+                    'type': boards[i].get('type'),
+                    'project_key': boards[i].get('location', {}).get('projectKey')
+                } 
+                for i in _parse_indices(selection, len(boards))
+            ]
         
         print(f"\nSelected {len(self.selected_boards)} board(s):")
         for board in self.selected_boards:
@@ -783,6 +1324,8 @@ class JiraManager:
     
     def _add_board_by_id_interactive(self):
         """Interactive method to add a board by ID"""
+        existing_ids = {b['id'] for b in self.selected_boards}
+        
         while True:
             board_id = input("\nEnter board ID (e.g., 21633): ").strip()
             if not board_id:
@@ -794,16 +1337,16 @@ class JiraManager:
             
             if board:
                 board_entry = {
-                    'id': board['id'],
+                    'id': str(board['id']),
                     'name': board['name'],
                     'type': board.get('type', 'unknown'),
                     'project_key': board.get('location', {}).get('projectKey', 'N/A')
                 }
                 
                 # Check if already exists
-                existing_ids = [str(b['id']) for b in self.selected_boards]
-                if str(board['id']) not in existing_ids:
+                if board_entry['id'] not in existing_ids:
                     self.selected_boards.append(board_entry)
+                    existing_ids.add(board_entry['id'])
                     print(f"✅ Added board: {board['name']} (ID: {board['id']})")
                     
                     # Ask if they want to add more
@@ -831,12 +1374,14 @@ class JiraManager:
         while start_idx < len(all_boards):
             end_idx = min(start_idx + page_size, len(all_boards))
             
-            print(f"\nBoards {start_idx + 1}-{end_idx} of {len(all_boards)}:")
+            # Write each page with a single call
+            lines = [f"\nBoards {start_idx + 1}-{end_idx} of {len(all_boards)}:"]
             for i in range(start_idx, end_idx):
                 board = all_boards[i]
                 board_type = board.get('type', 'unknown')
                 project_key = board.get('location', {}).get('projectKey', 'N/A')
-                print(f"{i+1:3}. {board['name']} ({board_type}) - Project: {project_key} - ID: {board['id']}")
+                lines.append(f"{i+1:3}. {board['name']} ({board_type}) - Project: {project_key} - ID: {board['id']}")
+            sys.stdout.write('\n'.join(lines) + '\n')
             
             if end_idx < len(all_boards):
                 action = input(f"\nEnter board numbers (comma-separated), 'next' for more, or 'done': ").strip()
@@ -850,28 +1395,28 @@ class JiraManager:
             
             # Process selection
             if action and action.lower() not in ['next', 'done']:
-                try:
-                    indices = [int(x.strip()) - 1 for x in action.split(',') if x.strip()]
-                    selected_boards = []
-                    
-                    for idx in indices:
-                        if 0 <= idx < len(all_boards):
-                            board = all_boards[idx]
-                            board_entry = {
-                                'id': board['id'],
-                                'name': board['name'],
-                                'type': board.get('type', 'unknown'),
-                                'project_key': board.get('location', {}).get('projectKey', 'N/A')
-                            }
-                            selected_boards.append(board_entry)
-                    
-                    if selected_boards:
-                        self.selected_boards.extend(selected_boards)
-                        print(f"\nAdded {len(selected_boards)} board(s):")
-                        for board in selected_boards:
-                            print(f"  • {board['name']} (ID: {board['id']})")
-                except ValueError:
-                    print("Invalid selection format.")
+                indices = _parse_indices(action, len(all_boards))
+                selected_boards = []
+                # Skip boards that are already selected or typed more than once
+                seen_ids = {b['id'] for b in self.selected_boards}
+                
+                for idx in indices:
+                    if str(all_boards[idx]['id']) not in seen_ids:
+                        board = all_boards[idx]
+                        seen_ids.add(str(board['id']))
+                        board_entry = {
+                            'id': str(board['id']),
+                            'name': board['name'],
+                            'type': board.get('type', 'unknown'),
+                            'project_key': board.get('location', {}).get('projectKey', 'N/A')
+                        }
+                        selected_boards.append(board_entry)
+                
+                if selected_boards:
+                    self.selected_boards.extend(selected_boards)
+                    print(f"\nAdded {len(selected_boards)} board(s):")
+                    for board in selected_boards:
+                        print(f"  • {board['name']} (ID: {board['id']})")
             
             break
     
@@ -894,144 +1439,184 @@ class JiraManager:
         else:
             print("  No boards selected")
     
-    def get_project_issues(self, project_key: str, max_results: int = 50) -> List[Dict[str, Any]]:
-        """Get issues for a specific project"""
+    def dump_selected_json(self):
+        """Write the URL and selected projects/boards as JSON, for scripts (credentials are never included)"""
+        sys.stdout.write(_dumps({
+            'base_url': self.base_url,
+            'selected_projects': self.selected_projects,
+            'selected_boards': self.selected_boards,
+        }) + '\n')
+    
+    @cached(ttl=ISSUE_CACHE_TTL)
+    def get_project_issues(self, project_key: str, max_results: Optional[int] = None, batch_size: int = 500,
+                           fields: str = 'summary,status,assignee,priority,created,updated') -> List[Dict[str, Any]]:
+        """Get issues for a specific project, returning only the requested fields.
+        
+        Pages through the search in batches of batch_size until every issue,
+        or max_results issues when given, has been fetched.
+        """
         try:
             jql = f"project = {project_key} ORDER BY updated DESC"
             params = {
                 'jql': jql,
-                'maxResults': max_results,
-                'fields': 'summary,status,assignee,priority,created,updated'
+                'maxResults': batch_size,
+                'fields': fields
             }
             
-            # Try API v3 first, fallback to v2
-            response = self.session.get(f"{self.base_url}/rest/api/3/search", params=params)
-            if response.status_code == 404:
-                response = self.session.get(f"{self.base_url}/rest/api/2/search", params=params)
+            issues, response = self._paginated_get(self._url_search, params, key='issues', max_results=max_results)
             
-            if response.status_code == 200:
-                return response.json().get('issues', [])
+            if issues is not None:
+                return issues
             else:
                 print(f"Failed to fetch issues for {project_key}: {response.status_code}")
                 return []
-        except requests.RequestException as e:
+        except (requests.RequestException, json.JSONDecodeError) as e:
             print(f"Error fetching issues for {project_key}: {e}")
             return []
     
-    def get_board_issues(self, board_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
-        """Get issues for a specific board using multiple methods"""
-        issues = []
+    @cached(ttl=ISSUE_CACHE_TTL)
+    def get_board_issues(self, board_id: str, max_results: Optional[int] = None, batch_size: int = 500,
+                         fields: str = _BOARD_ISSUE_FIELDS, project_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get issues for a specific board using multiple methods.
+        
+        The Agile API is tried first, then GreenHopper, then the board's project.
+        Whichever works is remembered per board and tried first next time.
+        Pass the board's project_key when it is already known so the project
+        fallback doesn't have to look the board up again.
+        """
+        methods = [
+            ('agile', self._board_issues_agile),
+            ('greenhopper', self._board_issues_greenhopper),
+            ('project', self._board_issues_from_project),
+        ]
+        choice = self._board_api_choice.get(str(board_id))
+        if choice:
+            methods.sort(key=lambda method: method[0] != choice)
+        
+        for name, fetch in methods:
+            issues = fetch(board_id, max_results, batch_size, fields, project_key)
+            if issues is not None:
+                self._board_api_choice[str(board_id)] = name
+                return issues
         
-        # Method 1: Try Agile API
+        return []
+    
+    def _board_issues_agile(self, board_id: str, max_results: Optional[int], batch_size: int, fields: str,
+                            project_key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Fetch board issues via the Agile API, or None if it is unavailable"""
         try:
-            params = {'maxResults': max_results}
-            response = self.session.get(f"{self.base_url}/rest/agile/1.0/board/{board_id}/issue", params=params)
-            if response.status_code == 200:
-                issues = response.json().get('issues', [])
+            params = {'maxResults': batch_size, 'fields': fields}
+            issues, response = self._paginated_get(self._url_agile_board_issues.format(board_id), params,
+                                                   key='issues', max_results=max_results)
+            if issues is not None:
                 print(f"Found {len(issues)} issues via Agile API")
                 return issues
             else:
                 print(f"Agile API failed for board issues: {response.status_code}")
-        except requests.RequestException as e:
+        except (requests.RequestException, json.JSONDecodeError) as e:
             print(f"Agile API error for board issues: {e}")
-        
-        # Method 2: Try GreenHopper API
+        return None
+    
+    def _board_issues_greenhopper(self, board_id: str, max_results: Optional[int], batch_size: int, fields: str,
+                                  project_key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Fetch board issues via the GreenHopper API, or None if it is unavailable"""
         try:
-            response = self.session.get(f"{self.base_url}/rest/greenhopper/1.0/xboard/work/allData/?rapidViewId={board_id}")
+            response = self.session.get(self._url_greenhopper_board_data.format(board_id), timeout=_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 issues_data = data.get('issuesData', {}).get('issues', [])
                 # Convert GreenHopper format to standard format
-                for issue_data in issues_data:
-                    issue = {
-                        'key': issue_data.get('key'),
-                        'id': issue_data.get('id'),
-                        'fields': {
-                            'summary': issue_data.get('summary'),
-                            'status': {
-                                'name': issue_data.get('statusName', 'Unknown'),
-                                'id': issue_data.get('statusId')
-                            },
-                            'assignee': {
-                                'displayName': issue_data.get('assigneeName', 'Unassigned')
-                            } if issue_data.get('assigneeName') else None,
-                            'priority': {
-                                'name': issue_data.get('priorityName', 'Unknown')
-                            },
-                            'issuetype': {
-                                'name': issue_data.get('typeName', 'Unknown')
-                            }
-                        }
-                    }
-                    issues.append(issue)
+                issues = [_wrap_gh(issue_data) for issue_data in issues_data]
                 print(f"Found {len(issues)} issues via GreenHopper API")
                 return issues
             else:
                 print(f"GreenHopper API failed for board issues: {response.status_code}")
-        except requests.RequestException as e:
+        except (requests.RequestException, json.JSONDecodeError) as e:
             print(f"GreenHopper API error for board issues: {e}")
-        
-        # Method 3: Fallback - get issues by project if we know the project
-        board_info = self.get_board_by_id(str(board_id))
-        if board_info:
-            project_key = board_info.get('location', {}).get('projectKey')
-            if project_key and project_key != 'N/A':
-                print(f"Fallback: Getting issues for project {project_key}")
-                return self.get_project_issues(project_key, max_results)
-        
-        return issues
+        return None
+    
+    def _board_issues_from_project(self, board_id: str, max_results: Optional[int], batch_size: int, fields: str,
+                                   project_key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Fallback - get issues by project if we know the board's project, else None"""
+        if not project_key or project_key == 'N/A':
+            board_info = self.get_board_by_id(str(board_id))
+            project_key = board_info.get('location', {}).get('projectKey') if board_info else None
+        if project_key and project_key != 'N/A':
+            print(f"Fallback: Getting issues for project {project_key}")
+            return self.get_project_issues(project_key, max_results, batch_size, fields=fields)
+        return None
     
-    def get_board_issues_by_status(self, board_id: str, statuses: List[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    def get_board_issues_by_status(self, board_id: str, statuses: Sequence[str] = None,
+                                   project_key: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """Get board issues grouped by status"""
         if statuses is None:
-            statuses = ['In Progress', 'In Review', 'Done', 'To Do', 'New', 'Open']
+            statuses = _DEFAULT_STATUSES + _BACKLOG_STATUSES
         
-        all_issues = self.get_board_issues(board_id)
-        issues_by_status = {}
+        cache_key = (str(board_id), tuple(statuses))
+        cached_entry = self._board_issue_cache.get(cache_key)
+        if cached_entry and time.time() - cached_entry[0] < STATUS_CACHE_TTL:
+            return cached_entry[1]
         
-        for status in statuses:
-            issues_by_status[status] = []
+        all_issues = self.get_board_issues(board_id, project_key=project_key)
         
-        # Also create a catch-all for unmapped statuses
-        issues_by_status['Other'] = []
+        # Boards use a handful of distinct status names, so resolve each one
+        # against the requested statuses once and reuse the bucket
+        lowered = [(status, status.lower()) for status in statuses]
+        bucket_for = {}
+        issues_by_status = {}
         
         for issue in all_issues:
-            issue_status = issue.get('fields', {}).get('status', {}).get('name', 'Unknown')
-            
-            # Try to find matching status (case-insensitive, partial match)
-            matched_status = None
-            for status in statuses:
-                if status.lower() in issue_status.lower() or issue_status.lower() in status.lower():
-                    matched_status = status
-                    break
+            issue_status = issue.get('fields', {}).get('status', {}).get('name', 'Unknown').lower()
             
-            if matched_status:
-                issues_by_status[matched_status].append(issue)
-            else:
-                issues_by_status['Other'].append(issue)
-        
-        # Remove empty categories
-        return {k: v for k, v in issues_by_status.items() if v}
+            bucket = bucket_for.get(issue_status)
+            if bucket is None:
+                # First matching status wins (case-insensitive, partial match), else the catch-all
+                bucket = bucket_for[issue_status] = next(
+                    (status for status, status_lower in lowered
+                     if status_lower in issue_status or issue_status in status_lower),
+                    'Other'
+                )
+            issues_by_status.setdefault(bucket, []).append(issue)
+        
+        # Keep the requested status order, omitting empty categories
+        issues_by_status = {status: issues_by_status[status] for status in [*statuses, 'Other'] if status in issues_by_status}
+        self._board_issue_cache[cache_key] = (time.time(), issues_by_status)
+        return issues_by_status
     
-    def display_board_issues(self, board_id: str, statuses: List[str] = None):
-        """Display board issues grouped by status"""
+    def display_board_issues(self, board_id: str, statuses: Sequence[str] = None, project_key: Optional[str] = None,
+                             issues_by_status: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        """Display board issues grouped by status.
+        
+        Pass issues_by_status when the board has already been grouped to skip
+        fetching and classifying it again.
+        """
         if statuses is None:
-            statuses = ['In Progress', 'In Review', 'Done']
+            statuses = _DEFAULT_STATUSES
         
         print(f"\n📋 Board Issues (ID: {board_id})")
         print("=" * 80)
         
-        issues_by_status = self.get_board_issues_by_status(board_id, statuses + ['To Do', 'New', 'Open'])
+        if issues_by_status is None:
+            issues_by_status = self.get_board_issues_by_status(board_id, [*statuses, *_BACKLOG_STATUSES], project_key)
         
         if not any(issues_by_status.values()):
             print("No issues found for this board.")
             return
         
-        for status in statuses:
-            if status in issues_by_status:
-                issues = issues_by_status[status]
-                print(f"\n🔸 {status.upper()} ({len(issues)} issues)")
-                print("-" * 60)
+        # Collect the listing and write it in one go rather than a print per line
+        lines = []
+        
+        # Groups come back in requested order, so list the selected statuses
+        # as they appear and queue the rest for the summary below
+        known = set(statuses)
+        other_statuses = []
+        
+        for status, issues in issues_by_status.items():
+            if status not in known:
+                other_statuses.append((status, issues))
+            else:
+                lines.append(f"\n🔸 {status.upper()} ({len(issues)} issues)")
+                lines.append("-" * 60)
                 
                 for issue in issues:
                     key = issue.get('key', 'Unknown')
@@ -1045,54 +1630,28 @@ class JiraManager:
                     if len(summary) > 60:
                         summary = summary[:57] + "..."
                     
-                    print(f"  • {key}: {summary}")
-                    print(f"    👤 {assignee_name} | 🏷️  {issue_type} | ⚡ {priority}")
+                    lines.append(f"  • {key}: {summary}")
+                    lines.append(f"    👤 {assignee_name} | 🏷️  {issue_type} | ⚡ {priority}")
         
         # Show other statuses if any
-        other_statuses = [k for k in issues_by_status.keys() if k not in statuses]
         if other_statuses:
-            print(f"\n🔸 OTHER STATUSES")
-            print("-" * 60)
-            for status in other_statuses:
-                issues = issues_by_status[status]
-                print(f"  {status}: {len(issues)} issues")
-    
-    def show_board_summary(self):
-        """Show summary of selected boards with issues by status"""
-        if not self.selected_boards:
-            print("No boards selected. Run 'select-boards' first.")
-            return
+            lines.append(f"\n🔸 OTHER STATUSES")
+            lines.append("-" * 60)
+            for status, issues in other_statuses:
+                lines.append(f"  {status}: {len(issues)} issues")
         
-        print("📊 Board Summary")
-        print("=" * 50)
-        
-        for board in self.selected_boards:
-            board_name = board['name']
-            board_id = board['id']
-            board_type = board.get('type', 'unknown')
-            
-            print(f"\n🔸 {board_name} ({board_type}) - ID: {board_id}")
-            
-            # Get issue counts by status
-            issues_by_status = self.get_board_issues_by_status(str(board_id))
-            
-            if issues_by_status:
-                total_issues = sum(len(issues) for issues in issues_by_status.values())
-                print(f"   Total issues: {total_issues}")
-                
-                status_summary = []
-                for status, issues in issues_by_status.items():
-                    status_summary.append(f"{status}: {len(issues)}")
-                
-                print(f"   Status breakdown: {', '.join(status_summary)}")
-            else:
-                print("   No issues found")
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def get_issues_by_date_range(self, board_id: str, days_back: int = 7) -> Dict[str, List[Dict[str, Any]]]:
-        """Get board issues filtered by date range and categorized by activity"""
-        all_issues = self.get_board_issues(board_id)
+    def get_issues_by_date_range(self, board_id: str, days_back: int = 7, project_key: Optional[str] = None,
+                                 fields: str = _BOARD_ISSUE_FIELDS) -> Dict[str, List[Dict[str, Any]]]:
+        """Get board issues filtered by date range and categorized by activity.
+        
+        The fields the report depends on are added to fields when missing.
+        """
+        requested = [f for f in (f.strip() for f in fields.split(',')) if f]
+        fields = ','.join(requested + [f for f in _REPORT_FIELDS if f not in requested])
+        all_issues = self.get_board_issues(board_id, fields=fields, project_key=project_key)
         # Use timezone-aware datetime to match JIRA dates
-        from datetime import timezone
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         
         categorized_issues = {
@@ -1105,27 +1664,16 @@ class JiraManager:
         for issue in all_issues:
             issue_status = issue.get('fields', {}).get('status', {}).get('name', '').lower()
             
-            # Parse dates (try multiple formats)
-            created_date = self._parse_jira_date(issue.get('fields', {}).get('created'))
-            updated_date = self._parse_jira_date(issue.get('fields', {}).get('updated'))
+            # Categorize based on status keywords
+            category = next((c for c, keywords in self._KWMAP if any(k in issue_status for k in keywords)), 'other')
             
-            # Categorize based on status and dates
-            if any(blocked_term in issue_status for blocked_term in ['blocked', 'impediment', 'hold', 'waiting', 'stuck']):
-                categorized_issues['blocked'].append(issue)
-            elif any(done_term in issue_status for done_term in ['done', 'closed', 'resolved', 'complete']):
-                # Check if completed in the past week
-                if updated_date and self._compare_dates(updated_date, cutoff_date):
-                    categorized_issues['completed'].append(issue)
-                else:
-                    categorized_issues['other'].append(issue)
-            elif any(progress_term in issue_status for progress_term in ['progress', 'development', 'active', 'working']):
-                # Check if started in the past week
-                if updated_date and self._compare_dates(updated_date, cutoff_date):
-                    categorized_issues['started'].append(issue)
-                else:
-                    categorized_issues['other'].append(issue)
-            else:
-                categorized_issues['other'].append(issue)
+            # Completed and started issues only count if updated within the period
+            if category in ('completed', 'started'):
+                updated_date = _parse_jira_date(issue.get('fields', {}).get('updated'))
+                if not (updated_date and self._compare_dates(updated_date, cutoff_date)):
+                    category = 'other'
+            
+            categorized_issues[category].append(issue)
         
         return categorized_issues
     
@@ -1142,89 +1690,82 @@ class JiraManager:
             else:
                 # Convert timezone-naive to UTC if the other is timezone-aware
                 if date1.tzinfo is None and date2.tzinfo is not None:
-                    from datetime import timezone
                     date1 = date1.replace(tzinfo=timezone.utc)
                 elif date2.tzinfo is None and date1.tzinfo is not None:
-                    from datetime import timezone
                     date2 = date2.replace(tzinfo=timezone.utc)
                 return date1 >= date2
         except Exception as e:
             print(f"Date comparison error: {e}")
             return False
     
-    def _parse_jira_date(self, date_str: str) -> Optional[datetime]:
-        """Parse JIRA date string to datetime object"""
-        if not date_str:
-            return None
-        
-        # Common JIRA date formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S.%f%z',  # 2024-01-15T10:30:45.123+0000
-            '%Y-%m-%dT%H:%M:%S%z',     # 2024-01-15T10:30:45+0000
-            '%Y-%m-%dT%H:%M:%S.%fZ',   # 2024-01-15T10:30:45.123Z
-            '%Y-%m-%dT%H:%M:%SZ',      # 2024-01-15T10:30:45Z
-            '%Y-%m-%d',                # 2024-01-15
-        ]
-        
-        for fmt in formats:
-            try:
-                # Handle Z timezone
-                clean_date = date_str.replace('Z', '+0000') if date_str.endswith('Z') else date_str
-                return datetime.strptime(clean_date, fmt)
-            except ValueError:
-                continue
-        
-        return None
-    
-    def generate_weekly_report(self, board_id: str, output_file: str = None, include_summaries: bool = True) -> str:
-        """Generate a weekly Kanban board report in markdown format"""
-        if output_file is None:
+    def generate_weekly_report(self, board_id: str, output_file: str = None, include_summaries: bool = True,
+                               project_key: Optional[str] = None, days_back: int = 7,
+                               issues_by_activity: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                               summaries: Optional[Dict[str, str]] = None, *,
+                               fp: Optional[TextIO] = None, now: Optional[datetime] = None) -> str:
+        """Generate a weekly Kanban board report in markdown format.
+        
+        Pass issues_by_activity from get_issues_by_date_range and summaries from
+        summarize_issues_parallel when they have already been computed, to avoid
+        fetching the board or the issue details twice. When fp is given the report
+        is written to that open file instead of output_file. Pass now to date the
+        report (and its default filename) from an existing clock reading.
+        """
+        if now is None:
+            now = datetime.now()
+        if output_file is None and fp is None:
             # Create filename with current date
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            output_file = f"Weekly_Kanban_Report_{current_date}.md"
-        
-        # Get board info
-        board_info = self.get_board_by_id(str(board_id))
+            output_file = f"kanban_report_{now:%Y%m%d}.md"
+        
+        # Get board info and categorized issues concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            board_future = executor.submit(self.get_board_by_id, str(board_id))
+            if issues_by_activity is None:
+                issues_future = executor.submit(self.get_issues_by_date_range, board_id, days_back, project_key)
+        board_info = board_future.result()
         board_name = board_info.get('name', f'Board {board_id}') if board_info else f'Board {board_id}'
-        
-        # Get categorized issues
-        issues_by_activity = self.get_issues_by_date_range(board_id, 7)
+        if issues_by_activity is None:
+            issues_by_activity = issues_future.result()
         
         # Generate report content
-        report_date = datetime.now().strftime('%B %d, %Y')
-        week_start = (datetime.now() - timedelta(days=7)).strftime('%B %d')
-        week_end = datetime.now().strftime('%B %d, %Y')
+        report_date = now.strftime('%B %d, %Y')
+        week_start = (now - timedelta(days=days_back)).strftime('%B %d')
+        week_end = report_date
         
         summary_note = "\n*Note: Executive summaries included for each issue.*" if include_summaries else ""
         
-        markdown_content = f"""# Weekly Kanban Board Report
+        # Summarize every reported issue up front from batched searches
+        if include_summaries and summaries is None:
+            keys = [issue['key'] for category in ('started', 'completed', 'blocked')
+                    for issue in issues_by_activity[category] if issue.get('key')]
+            summaries = self.summarize_issues_parallel(keys)
+        
+        header = f"""# Weekly Kanban Board Report
 **Board:** {board_name}  
 **Report Date:** {report_date}  
 **Period:** {week_start} - {week_end}  {summary_note}
 
 ---
-
-## Started
-*Jiras (with links), or other, work started in the past week*
-
-{self._format_issues_for_report(issues_by_activity['started'], 'started', include_summaries)}
-
----
-
-## Completed
-*Jiras (with links), or other, work completed in the past week*
-
-{self._format_issues_for_report(issues_by_activity['completed'], 'completed', include_summaries)}
-
----
-
-## Blocked / Off-track
-*Jiras (with links), or other, work blocked or off-track in the past week*
-
-{self._format_issues_for_report(issues_by_activity['blocked'], 'blocked', include_summaries)}
-
----
-
+"""
+        
+        if fp is not None:
+            self._render_report(fp, header, issues_by_activity, include_summaries, summaries, now)
+            return getattr(fp, 'name', output_file)
+        
+        # Stream the report to disk section by section
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            self._render_report(f, header, issues_by_activity, include_summaries, summaries, now)
+        
+        return output_file
+    
+    def _render_report(self, fp: TextIO, header: str, issues_by_activity: Dict[str, List[Dict[str, Any]]],
+                       include_summaries: bool, summaries: Optional[Dict[str, str]], now: datetime):
+        """Write the report to fp one section at a time, without building it in memory"""
+        fp.write(header)
+        for category, title, activity in self._REPORT_SECTIONS:
+            self._render_section(fp, issues_by_activity[category], category, title, activity,
+                                 include_summaries, summaries)
+        fp.write(f"""
 ## Risks
 *Manager assessment of any risks and mitigation steps*
 
@@ -1236,63 +1777,58 @@ class JiraManager:
 
 ---
 
-*Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} using Jira Manager*
-"""
-        
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        return output_file
+*Report generated on {now:%Y-%m-%d %H:%M:%S} using Jira Manager*
+""")
+    
+    def _render_section(self, fp: TextIO, issues: List[Dict[str, Any]], category: str, title: str, activity: str,
+                        include_summaries: bool = True, summaries: Optional[Dict[str, str]] = None):
+        """Write one report section to fp, issue by issue"""
+        fp.write(f"\n## {title}\n*Jiras (with links), or other, work {activity} in the past week*\n\n")
+        fp.writelines(self._iter_issue_lines(issues, category, include_summaries, summaries))
+        fp.write("\n---\n")
     
-    def _format_issues_for_report(self, issues: List[Dict[str, Any]], category: str, include_summaries: bool = True) -> str:
-        """Format issues for markdown report with optional executive summaries"""
+    def _iter_issue_lines(self, issues: List[Dict[str, Any]], category: str, include_summaries: bool = True,
+                          summaries: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """Yield the markdown lines for a report section, with optional executive summaries"""
         if not issues:
-            return "*No items for this period.*\n"
+            yield "*No items for this period.*\n"
+            yield "\n"
+            return
+        
+        if include_summaries and summaries is None:
+            summaries = self.summarize_issues_parallel([issue['key'] for issue in issues if issue.get('key')])
         
-        formatted_lines = []
+        template = self._REPORT_TMPLS.get(category, '')
+        browse = f"{self.base_url}/browse/"
         
         for issue in issues:
             key = issue.get('key', 'Unknown')
-            summary = issue.get('fields', {}).get('summary', 'No summary')
-            assignee = issue.get('fields', {}).get('assignee')
-            assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-            priority = issue.get('fields', {}).get('priority', {}).get('name', 'Unknown')
-            status = issue.get('fields', {}).get('status', {}).get('name', 'Unknown')
-            
-            # Create JIRA link
-            jira_link = f"[{key}]({self.base_url}/browse/{key})"
+            fields = issue.get('fields', {})
+            assignee = fields.get('assignee')
             
-            # Format line based on category
-            if category == 'started':
-                formatted_lines.append(f"### {jira_link}: {summary}")
-                formatted_lines.append(f"**Assignee:** {assignee_name} | **Priority:** {priority}")
-            elif category == 'completed':
-                formatted_lines.append(f"### ✅ {jira_link}: {summary}")
-                formatted_lines.append(f"**Assignee:** {assignee_name}")
-            elif category == 'blocked':
-                formatted_lines.append(f"### 🚫 {jira_link}: {summary}")
-                formatted_lines.append(f"**Status:** {status} | **Assignee:** {assignee_name}")
-                formatted_lines.append(f"**Blocking Reason:** *[TODO: Add blocking reason]*")
+            # Build each issue as one block: header lines, optional summary, spacing
+            block = template.format_map({
+                'key': key,
+                'browse': browse,
+                'summary': fields.get('summary', 'No summary'),
+                'assignee': assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned',
+                'priority': fields.get('priority', {}).get('name', 'Unknown'),
+                'status': fields.get('status', {}).get('name', 'Unknown'),
+            })
             
             # Add executive summary if requested
             if include_summaries:
-                print(f"🔍 Generating executive summary for {key}...")
-                issue_details = self.get_issue_details(key)
-                if issue_details:
-                    exec_summary = self.generate_executive_summary(issue_details)
-                    formatted_lines.append(f"\n**Executive Summary:**")
-                    formatted_lines.append(exec_summary)
+                exec_summary = summaries.get(key)
+                if exec_summary:
+                    block += f"\n**Executive Summary:**\n{exec_summary}\n"
                     print(f"✅ Summary generated for {key}")
                 else:
-                    formatted_lines.append(f"\n**Executive Summary:** Unable to fetch detailed information for this issue.")
+                    block += "\n**Executive Summary:** Unable to fetch detailed information for this issue.\n"
                     print(f"❌ Failed to fetch details for {key}")
             else:
                 print(f"⏭️  Skipping summary for {key} (summaries disabled)")
             
-            formatted_lines.append("")  # Add spacing between issues
-            
-        return '\n'.join(formatted_lines)
+            yield block + "\n"  # Add spacing between issues
     
     def show_project_summary(self):
         """Show summary of selected projects"""
@@ -1305,7 +1841,7 @@ class JiraManager:
         
         for project in self.selected_projects:
             print(f"\n🔸 {project['name']} ({project['key']})")
-            issues = self.get_project_issues(project['key'], 10)
+            issues = self.get_project_issues(project['key'], 10, fields='summary,status')
             print(f"   Recent issues: {len(issues)}")
             
             if issues:
@@ -1315,8 +1851,28 @@ class JiraManager:
                     status = issue['fields']['status']['name']
                     print(f"     • {issue['key']}: {summary} [{status}]")
     
-    def show_board_summary(self):
-        """Show summary of selected boards"""
+    def display_board_issues_bulk(self, boards: List[Dict[str, Any]], statuses: Sequence[str] = None):
+        """Display issues for several boards, fetching them concurrently and printing in the given order"""
+        if not boards:
+            return
+        if statuses is None:
+            statuses = _DEFAULT_STATUSES
+        
+        grouping = [*statuses, *_BACKLOG_STATUSES]
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(boards))) as executor:
+            grouped = list(executor.map(
+                lambda board: self.get_board_issues_by_status(board['id'], grouping, board.get('project_key')),
+                boards
+            ))
+        
+        separator = "\n" + "=" * 80 + "\n"
+        for board, issues_by_status in zip(boards, grouped):
+            print(f"\n📋 {board['name']} (ID: {board['id']})")
+            self.display_board_issues(board['id'], statuses, board.get('project_key'), issues_by_status)
+            sys.stdout.write(separator)
+    
+    def show_board_summary(self, with_status_breakdown: bool = False):
+        """Show summary of selected boards, optionally counting every issue by status"""
         if not self.selected_boards:
             print("No boards selected. Run 'setup' first.")
             return
@@ -1324,194 +1880,344 @@ class JiraManager:
         print("📊 Board Summary")
         print("=" * 50)
         
-        for board in self.selected_boards:
+        if with_status_breakdown:
+            def fetch(board):
+                return self.get_board_issues_by_status(board['id'], project_key=board.get('project_key'))
+        else:
+            def fetch(board):
+                return self.get_board_issues(board['id'], 10, fields='summary,status',
+                                             project_key=board.get('project_key'))
+        
+        # Fetch all boards concurrently, then print in selection order
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(self.selected_boards))) as executor:
+            results = list(executor.map(fetch, self.selected_boards))
+        
+        for board, result in zip(self.selected_boards, results):
+            if with_status_breakdown:
+                print(f"\n🔸 {board['name']} ({board.get('type', 'unknown')}) - ID: {board['id']}")
+                
+                if result:
+                    total_issues = sum(len(issues) for issues in result.values())
+                    print(f"   Total issues: {total_issues}")
+                    status_summary = [f"{status}: {len(issues)}" for status, issues in result.items()]
+                    print(f"   Status breakdown: {', '.join(status_summary)}")
+                else:
+                    print("   No issues found")
+                continue
+            
             print(f"\n🔸 {board['name']} ({board['type']})")
-            issues = self.get_board_issues(str(board['id']), 10)
-            print(f"   Issues: {len(issues)}")
+            print(f"   Issues: {len(result)}")
             
-            if issues:
+            if result:
                 print("   Latest issues:")
-                for issue in issues[:3]:
+                for issue in result[:3]:
                     summary = issue['fields']['summary'][:50] + "..." if len(issue['fields']['summary']) > 50 else issue['fields']['summary']
                     status = issue['fields']['status']['name']
                     print(f"     • {issue['key']}: {summary} [{status}]")
 
-def main():
-    parser = argparse.ArgumentParser(description='Jira Project and Board Manager')
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Setup command
-    subparsers.add_parser('setup', help='Interactive setup for Jira connection and preferences')
+def _add_setup_parser(subparsers, common):
+    subparsers.add_parser('setup', parents=[common], help='Interactive setup for Jira connection and preferences')
+
+def _add_select_project_parser(subparsers, common):
+    subparsers.add_parser('select-project', parents=[common], help='Select a project by name or key')
+
+def _add_select_boards_parser(subparsers, common):
+    subparsers.add_parser('select-boards', parents=[common], help='Select boards from currently selected projects')
+
+def _add_add_board_parser(subparsers, common):
+    add_board_parser = subparsers.add_parser('add-board', parents=[common], help='Add a specific board by ID')
+    add_board_parser.add_argument('board_id', help='Board ID to add (e.g., 21633)')
+
+def _add_json_argument(parser, instead_of: str):
+    parser.add_argument('--json', action='store_true',
+                        help=f'Print the configured selection of projects and boards as compact JSON '
+                             f'instead of {instead_of}')
+
+def _add_list_parser(subparsers, common):
+    list_parser = subparsers.add_parser('list', parents=[common], help='List selected projects and boards')
+    _add_json_argument(list_parser, 'the formatted list')
+
+def _add_projects_parser(subparsers, common):
+    projects_parser = subparsers.add_parser('projects', parents=[common], help='Show summary of selected projects')
+    _add_json_argument(projects_parser, 'the project summary (no project data is fetched)')
+
+def _add_boards_parser(subparsers, common):
+    boards_parser = subparsers.add_parser('boards', parents=[common], help='Show summary of selected boards')
+    _add_json_argument(boards_parser, 'the board summary (no board data is fetched)')
+    boards_parser.add_argument('--status-breakdown', action='store_true',
+                               help='Count every issue on each board by status instead of listing the latest few')
+
+def _add_board_issues_parser(subparsers, common):
+    board_issues_parser = subparsers.add_parser('board-issues', parents=[common], help='Show issues for a specific board by status')
+    board_issues_parser.add_argument('board_id', nargs='?', help='Board ID to show issues for')
+    board_issues_parser.add_argument('--status', nargs='*', default=list(_DEFAULT_STATUSES), 
+                                    help='Status filters (default: In Progress, In Review, Done)')
+
+def _add_all_board_issues_parser(subparsers, common):
+    subparsers.add_parser('all-board-issues', parents=[common], help='Show issues for all selected boards')
+
+def _add_weekly_report_parser(subparsers, common):
+    weekly_report_parser = subparsers.add_parser('weekly-report', parents=[common], help='Generate weekly Kanban board report')
+    weekly_report_parser.add_argument('board_id', nargs='?', help='Board ID to generate report for')
+    weekly_report_parser.add_argument('--output', '-o', help='Output filename (default: kanban_report_YYYYMMDD.md)')
+    weekly_report_parser.add_argument('--days', type=int, default=7, help='Number of days back to analyze (default: 7)')
+    weekly_report_parser.add_argument('--no-summary', action='store_true', help='Skip executive summaries for faster generation')
+    weekly_report_parser.add_argument('--fields', default=_BOARD_ISSUE_FIELDS,
+                                      help=f'Comma-separated issue fields to fetch (default: {_BOARD_ISSUE_FIELDS}); '
+                                           f'{",".join(_REPORT_FIELDS)} are always included')
+
+def _add_test_parser(subparsers, common):
+    subparsers.add_parser('test', parents=[common], help='Test Jira connection')
+
+# Subcommand name -> function registering its parser, in help order
+COMMANDS = {
+    'setup': _add_setup_parser,
+    'select-project': _add_select_project_parser,
+    'select-boards': _add_select_boards_parser,
+    'add-board': _add_add_board_parser,
+    'list': _add_list_parser,
+    'projects': _add_projects_parser,
+    'boards': _add_boards_parser,
+    'board-issues': _add_board_issues_parser,
+    'all-board-issues': _add_all_board_issues_parser,
+    'weekly-report': _add_weekly_report_parser,
+    'test': _add_test_parser,
+}
+
+def _load_or_die(refresh: bool = False) -> 'JiraManager':
+    """Create a JiraManager from the saved configuration, exiting if there is none"""
+    jira = JiraManager()
+    if not jira.load_config():
+        print("No configuration found. Please run 'setup' first.")
+        sys.exit(1)
+    # Skip cached reads but still overwrite entries, leaving other accounts' cache alone
+    jira.refresh_cache = refresh
+    return jira
+
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv without parsing it, or None for help or anything unrecognised"""
+    # Top-level options (only -h/--help) come before the command
+    if argv and argv[0] in COMMANDS:
+        return argv[0]
+    return None
+
+def _get_parser(command: Optional[str] = None):
+    """Build the CLI parser, registering only the given command's subparser when it is known.
     
-    # Select project command
-    subparsers.add_parser('select-project', help='Select a project by name or key')
+    Help, no command or an unknown one registers them all for the listing
+    and the error message.
+    """
+    import argparse  # Only needed when run as a CLI
     
-    # Select boards command
-    subparsers.add_parser('select-boards', help='Select boards from currently selected projects')
+    parser = argparse.ArgumentParser(description='Jira Project and Board Manager')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Add board by ID command
-    add_board_parser = subparsers.add_parser('add-board', help='Add a specific board by ID')
-    add_board_parser.add_argument('board_id', help='Board ID to add (e.g., 21633)')
+    # Options shared by every command
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--refresh', action='store_true', help='Ignore cached Jira lookups and fetch fresh data')
+    common.add_argument('--clear-cache', action='store_true',
+                        help=f'Delete every cached Jira lookup in {CACHE_FILE} (all instances and accounts) first')
     
-    # List command
-    subparsers.add_parser('list', help='List selected projects and boards')
+    if command in COMMANDS:
+        COMMANDS[command](subparsers, common)
+    else:
+        for add_parser in COMMANDS.values():
+            add_parser(subparsers, common)
+    return parser
+
+def _cmd_setup(args):
+    """Run the interactive setup; the only command that works without a saved configuration"""
+    JiraManager().interactive_setup()
+
+def _cmd_test(args):
+    """Test the Jira connection"""
+    jira = _load_or_die(args.refresh)
+    if jira.test_connection():
+        print("✅ Connection successful!")
+    else:
+        print("❌ Connection failed!")
+
+def _cmd_select_project(args):
+    """Interactively select projects and save them"""
+    jira = _load_or_die(args.refresh)
+    print("🔍 Project Selection")
+    print("=" * 50)
+    jira.select_projects()
+    jira.save_config()
+
+def _cmd_select_boards(args):
+    """Interactively select boards from the selected projects and save them"""
+    jira = _load_or_die(args.refresh)
+    print("📋 Board Selection")
+    print("=" * 50)
+    jira.select_boards()
+    jira.save_config()
+
+def _cmd_add_board(args):
+    """Add a board to the selection by ID"""
+    jira = _load_or_die(args.refresh)
+    print(f"🎯 Adding Board ID: {args.board_id}")
+    print("=" * 50)
+    board = jira.get_board_by_id(args.board_id)
+    if board:
+        # Check if already exists
+        existing_ids = {b['id'] for b in jira.selected_boards}
+        if str(board['id']) not in existing_ids:
+            # Add to selected boards
+            board_entry = {
+                'id': str(board['id']),
+                'name': board['name'],
+                'type': board.get('type', 'unknown'),
+                'project_key': board.get('location', {}).get('projectKey', 'N/A')
+            }
+            jira.selected_boards.append(board_entry)
+            jira.save_config()
+            print(f"✅ Added board: {board['name']} (ID: {board['id']})")
+        else:
+            print(f"⚠️  Board already selected: {board['name']}")
+    else:
+        print(f"❌ Board with ID {args.board_id} not found or not accessible")
+
+def _cmd_list(args):
+    """List the selected projects and boards"""
+    jira = _load_or_die(args.refresh)
+    if args.json:
+        jira.dump_selected_json()
+        return
+    jira.list_selected_resources()
+
+def _cmd_projects(args):
+    """Summarize the selected projects"""
+    jira = _load_or_die(args.refresh)
+    if args.json:
+        jira.dump_selected_json()
+        return
+    jira.show_project_summary()
+
+def _cmd_boards(args):
+    """Summarize the selected boards"""
+    jira = _load_or_die(args.refresh)
+    if args.json:
+        jira.dump_selected_json()
+        return
+    jira.show_board_summary(args.status_breakdown)
+
+def _cmd_board_issues(args):
+    """Show one board, or every selected board, grouped by status"""
+    jira = _load_or_die(args.refresh)
+    if args.board_id:
+        jira.display_board_issues(args.board_id, args.status)
+    else:
+        # Show issues for all selected boards
+        if not jira.selected_boards:
+            print("No boards selected. Run 'select-boards' first or specify a board ID.")
+            return
+        
+        jira.display_board_issues_bulk(jira.selected_boards, args.status)
+
+def _cmd_all_board_issues(args):
+    """Show issues for every selected board"""
+    jira = _load_or_die(args.refresh)
+    if not jira.selected_boards:
+        print("No boards selected. Run 'select-boards' first.")
+        return
     
-    # Project summary
-    subparsers.add_parser('projects', help='Show summary of selected projects')
+    jira.display_board_issues_bulk(jira.selected_boards, _DEFAULT_STATUSES)
+
+def _cmd_weekly_report(args):
+    """Generate the weekly Kanban report for a board"""
+    jira = _load_or_die(args.refresh)
+    project_key = None
+    if args.board_id:
+        board_id = args.board_id
+    else:
+        # Use first selected board if no board ID provided
+        if not jira.selected_boards:
+            print("No boards selected and no board ID provided. Run 'select-boards' first or specify a board ID.")
+            return
+        board_id = jira.selected_boards[0]['id']
+        project_key = jira.selected_boards[0].get('project_key')
+        print(f"Using selected board: {jira.selected_boards[0]['name']} (ID: {board_id})")
     
-    # Board summary
-    subparsers.add_parser('boards', help='Show summary of selected boards')
+    include_summaries = not args.no_summary
+    summary_text = "with executive summaries" if include_summaries else "without executive summaries"
+    print(f"📊 Generating weekly report for board {board_id} ({summary_text})...")
     
-    # Board issues command
-    board_issues_parser = subparsers.add_parser('board-issues', help='Show issues for a specific board by status')
-    board_issues_parser.add_argument('board_id', nargs='?', help='Board ID to show issues for')
-    board_issues_parser.add_argument('--status', nargs='*', default=['In Progress', 'In Review', 'Done'], 
-                                    help='Status filters (default: In Progress, In Review, Done)')
+    issues_by_activity = jira.get_issues_by_date_range(board_id, args.days, project_key, args.fields)
     
-    # All board issues command
-    subparsers.add_parser('all-board-issues', help='Show issues for all selected boards')
+    # Show what we found before generating
+    started, completed, blocked = (issues_by_activity[k] for k in ('started', 'completed', 'blocked'))
+    started_count, completed_count, blocked_count = map(len, (started, completed, blocked))
+    total_issues = started_count + completed_count + blocked_count
+    found = [
+        f"\n📋 Found {total_issues} issues to include in report:",
+        f"   Started: {started_count} items",
+        f"   Completed: {completed_count} items",
+        f"   Blocked: {blocked_count} items",
+    ]
+    # Without an explicit --output there's nothing worth writing for an idle board
+    skip_report = total_issues == 0 and not args.output
+    if skip_report:
+        found.append("⚠️  No issues found for the specified time period. Skipping report "
+                     "(pass --output to write the template anyway).")
+    elif total_issues == 0:
+        found.append("⚠️  No issues found for the specified time period. Report will contain template sections only.")
+    sys.stdout.write('\n'.join(found) + '\n')
+    sys.stdout.flush()
+    if skip_report:
+        return
     
-    # Weekly report command
-    weekly_report_parser = subparsers.add_parser('weekly-report', help='Generate weekly Kanban board report')
-    weekly_report_parser.add_argument('board_id', nargs='?', help='Board ID to generate report for')
-    weekly_report_parser.add_argument('--output', '-o', help='Output filename (default: kanban_report_YYYYMMDD.md)')
-    weekly_report_parser.add_argument('--days', type=int, default=7, help='Number of days back to analyze (default: 7)')
-    weekly_report_parser.add_argument('--no-summary', action='store_true', help='Skip executive summaries for faster generation')
+    # Summarize all reported issues in one concurrent pass
+    summaries = None
+    if include_summaries:
+        summaries = jira.summarize_issues_parallel([issue['key'] for issue in started + completed + blocked
+                                                    if issue.get('key')])
     
-    # Test connection
-    subparsers.add_parser('test', help='Test Jira connection')
+    # Generate report, dating the file and the console output from one clock reading
+    print(f"\n🔄 Generating markdown report...")
+    now = datetime.now()
+    output_file = jira.generate_weekly_report(board_id, args.output, include_summaries, project_key,
+                                              args.days, issues_by_activity, summaries, now=now)
     
+    done = [
+        f"\n✅ Weekly report generated successfully!",
+        f"📄 File: {output_file}",
+        f"📅 Date: {now:%Y-%m-%d %H:%M:%S}",
+    ]
+    if include_summaries and total_issues > 0:
+        done.append("📝 Executive summaries included for all issues")
+    elif total_issues > 0:
+        done.append("⚡ Quick report generated (no executive summaries)")
+    sys.stdout.write('\n'.join(done) + '\n')
+    sys.stdout.flush()
+
+# Subcommand name -> function running it
+HANDLERS = {
+    'setup': _cmd_setup,
+    'test': _cmd_test,
+    'select-project': _cmd_select_project,
+    'select-boards': _cmd_select_boards,
+    'add-board': _cmd_add_board,
+    'list': _cmd_list,
+    'projects': _cmd_projects,
+    'boards': _cmd_boards,
+    'board-issues': _cmd_board_issues,
+    'all-board-issues': _cmd_all_board_issues,
+    'weekly-report': _cmd_weekly_report,
+}
+
+def main():
+    parser = _get_parser(_peek_command(sys.argv[1:]))
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
     
-    # Initialize Jira manager
-    jira = JiraManager()
+    if args.clear_cache:
+        JiraManager().clear_cache()
     
-    if args.command == 'setup':
-        jira.interactive_setup()
-    else:
-        # Load existing configuration
-        if not jira.load_config():
-            print("No configuration found. Please run 'setup' first.")
-            return
-        
-        if args.command == 'test':
-            if jira.test_connection():
-                print("✅ Connection successful!")
-            else:
-                print("❌ Connection failed!")
-        
-        elif args.command == 'select-project':
-            print("🔍 Project Selection")
-            print("=" * 50)
-            jira.select_projects()
-            jira.save_config()
-        
-        elif args.command == 'select-boards':
-            print("📋 Board Selection")
-            print("=" * 50)
-            jira.select_boards()
-            jira.save_config()
-        
-        elif args.command == 'add-board':
-            print(f"🎯 Adding Board ID: {args.board_id}")
-            print("=" * 50)
-            board = jira.get_board_by_id(args.board_id)
-            if board:
-                # Add to selected boards
-                board_entry = {
-                    'id': board['id'],
-                    'name': board['name'],
-                    'type': board.get('type', 'unknown'),
-                    'project_key': board.get('location', {}).get('projectKey', 'N/A')
-                }
-                
-                # Check if already exists
-                existing_ids = [b['id'] for b in jira.selected_boards]
-                if str(board['id']) not in [str(id) for id in existing_ids]:
-                    jira.selected_boards.append(board_entry)
-                    jira.save_config()
-                    print(f"✅ Added board: {board['name']} (ID: {board['id']})")
-                else:
-                    print(f"⚠️  Board already selected: {board['name']}")
-            else:
-                print(f"❌ Board with ID {args.board_id} not found or not accessible")
-        
-        elif args.command == 'list':
-            jira.list_selected_resources()
-        
-        elif args.command == 'projects':
-            jira.show_project_summary()
-        
-        elif args.command == 'boards':
-            jira.show_board_summary()
-        
-        elif args.command == 'board-issues':
-            if args.board_id:
-                jira.display_board_issues(args.board_id, args.status)
-            else:
-                # Show issues for all selected boards
-                if not jira.selected_boards:
-                    print("No boards selected. Run 'select-boards' first or specify a board ID.")
-                    return
-                
-                for board in jira.selected_boards:
-                    jira.display_board_issues(str(board['id']), args.status)
-                    print("\n" + "="*80 + "\n")
-        
-        elif args.command == 'all-board-issues':
-            if not jira.selected_boards:
-                print("No boards selected. Run 'select-boards' first.")
-                return
-            
-            for board in jira.selected_boards:
-                print(f"\n📋 {board['name']} (ID: {board['id']})")
-                jira.display_board_issues(str(board['id']), ['In Progress', 'In Review', 'Done'])
-                print("\n" + "="*80)
-        
-        elif args.command == 'weekly-report':
-            if args.board_id:
-                board_id = args.board_id
-            else:
-                # Use first selected board if no board ID provided
-                if not jira.selected_boards:
-                    print("No boards selected and no board ID provided. Run 'select-boards' first or specify a board ID.")
-                    return
-                board_id = str(jira.selected_boards[0]['id'])
-                print(f"Using selected board: {jira.selected_boards[0]['name']} (ID: {board_id})")
-            
-            include_summaries = not args.no_summary
-            summary_text = "with executive summaries" if include_summaries else "without executive summaries"
-            print(f"📊 Generating weekly report for board {board_id} ({summary_text})...")
-            
-            # Update the method call to include days parameter
-            issues_by_activity = jira.get_issues_by_date_range(board_id, args.days)
-            
-            # Show what we found before generating
-            total_issues = len(issues_by_activity['started']) + len(issues_by_activity['completed']) + len(issues_by_activity['blocked'])
-            print(f"\n📋 Found {total_issues} issues to include in report:")
-            print(f"   Started: {len(issues_by_activity['started'])} items")
-            print(f"   Completed: {len(issues_by_activity['completed'])} items")
-            print(f"   Blocked: {len(issues_by_activity['blocked'])} items")
-            
-            if total_issues == 0:
-                print("⚠️  No issues found for the specified time period. Report will contain template sections only.")
-            
-            # Generate report
-            print(f"\n🔄 Generating markdown report...")
-            output_file = jira.generate_weekly_report(board_id, args.output, include_summaries)
-            
-            print(f"\n✅ Weekly report generated successfully!")
-            print(f"📄 File: {output_file}")
-            print(f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            if include_summaries and total_issues > 0:
-                print("📝 Executive summaries included for all issues")
-            elif total_issues > 0:
-                print("⚡ Quick report generated (no executive summaries)")
+    HANDLERS[args.command](args)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file